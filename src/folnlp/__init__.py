@@ -3,7 +3,13 @@
 from .fol_to_nl import ConversionError, FOLToNLConverter, convert_fol_to_natural_language
 from .nl_parser import NLToFOLParser, ParseError, parse_natural_language
 from .tokenizer import Token, TokenType, Tokenizer, tokenize
-from .translator import TranslationError, translate_fol_to_nl, translate_nl_to_fol
+from .translator import (
+    TranslationError,
+    translate_fol_to_nl,
+    translate_fol_to_nl_batch,
+    translate_nl_to_fol,
+    translate_nl_to_fol_batch,
+)
 
 __all__ = [
     "ConversionError",
@@ -18,5 +24,7 @@ __all__ = [
     "parse_natural_language",
     "tokenize",
     "translate_fol_to_nl",
+    "translate_fol_to_nl_batch",
     "translate_nl_to_fol",
+    "translate_nl_to_fol_batch",
 ]
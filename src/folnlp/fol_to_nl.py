@@ -2,14 +2,78 @@
 
 from __future__ import annotations
 
+import re
 from contextlib import contextmanager
-from typing import Dict, Iterator, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 class ConversionError(ValueError):
     """Raised when a FOL formula cannot be rendered in natural language."""
 
 
+# Token kinds for the FOL token stream; plain ints keep parser dispatch cheap.
+_EOF = -1
+_FORALL, _EXISTS, _NOT, _LPAREN, _RPAREN, _COMMA, _AND, _OR, _IMP, _IFF, _IDENT = range(11)
+
+_SYMBOL_KINDS = {
+    "∀": _FORALL,
+    "∃": _EXISTS,
+    "¬": _NOT,
+    "(": _LPAREN,
+    ")": _RPAREN,
+    ",": _COMMA,
+    "∧": _AND,
+    "∨": _OR,
+    "→": _IMP,
+    "↔": _IFF,
+}
+
+_FOL_TOKEN_RE = re.compile(r"\s+|([∀∃¬()∧∨→↔,])|([A-Za-z]+)")
+
+_EOF_TOKEN = (_EOF, "")
+
+# Plural-verb suffix rules as one pattern plus a replacement table; scanning
+# left to right makes the longest applicable suffix win, matching the old
+# endswith cascade.
+_PLURAL_RE = re.compile(r"(ies|ches|shes|ses|xes|zes|es|(?<!s)s)$")
+_PLURAL_REPLACE = {
+    "ies": "y",
+    "ches": "ch",
+    "shes": "sh",
+    "ses": "s",
+    "xes": "x",
+    "zes": "z",
+    "es": "e",
+    "s": "",
+}
+
+
+def _pluralize_verb(verb: str) -> str:
+    match = _PLURAL_RE.search(verb)
+    if match is None:
+        return verb
+    return verb[: match.start()] + _PLURAL_REPLACE[match.group(1)]
+
+
+def _tokenize_fol(formula: str) -> List[Tuple[int, str]]:
+    """Split *formula* into a list of (kind, value) tokens in one regex pass."""
+    tokens: List[Tuple[int, str]] = []
+    position = 0
+    for match in _FOL_TOKEN_RE.finditer(formula):
+        if match.start() != position:
+            raise ConversionError(f"unexpected character {formula[position]!r}")
+        position = match.end()
+        symbol = match.group(1)
+        if symbol is not None:
+            tokens.append((_SYMBOL_KINDS[symbol], symbol))
+        elif match.group(2) is not None:
+            tokens.append((_IDENT, match.group(2)))
+    if position != len(formula):
+        raise ConversionError(f"unexpected character {formula[position]!r}")
+    return tokens
+
+
 PREDICATE_MAP = {
     "Human": "is human",
     "Mortal": "is mortal",
@@ -31,178 +95,254 @@ PREDICATE_MAP = {
 }
 
 
-class FOLToNLConverter:
-    def __init__(self, formula: str):
-        self._formula = formula.strip()
-        self._position = 0
-        self._bindings: Dict[str, Tuple[str, str, bool]] = {}
-        self._binding_stack: List[str] = []
+@lru_cache(maxsize=256)
+def _render_entry(natural_predicate: str) -> Tuple[str, str, str, str]:
+    """Precompute (unary singular, unary plural, binary singular, binary plural).
+
+    The first two are templates taking the subject; the last two are the
+    conjugated verb phrase for the binary form. Known predicates are filled
+    in at import below; unknown ones are built on first use and cached.
+    """
+    if natural_predicate.startswith("is "):
+        rest = natural_predicate[2:]
+        return ("{s} is" + rest, "{s} are" + rest, "is" + rest, "are" + rest)
+    return (
+        "{s} " + natural_predicate,
+        "{s} " + natural_predicate,
+        natural_predicate,
+        _pluralize_verb(natural_predicate),
+    )
+
+
+for _natural in PREDICATE_MAP.values():
+    _render_entry(_natural)
+del _natural
+
+
+# AST node kinds. Nodes are plain tuples starting with one of these ints:
+#   (_N_FORALL, variable, body-or-None)
+#   (_N_EXISTS, variable, body-or-None)
+#   (_N_NOT, body)
+#   (_N_AND | _N_OR | _N_IMP | _N_IFF, left, right)
+#   (_N_ATOM, predicate, args-tuple-or-None)   None means "no argument list"
+_N_FORALL, _N_EXISTS, _N_NOT, _N_AND, _N_OR, _N_IMP, _N_IFF, _N_ATOM = range(8)
+
+_BINARY_NODE_KINDS = {
+    _AND: _N_AND,
+    _OR: _N_OR,
+    _IMP: _N_IMP,
+    _IFF: _N_IFF,
+}
 
-    def convert(self) -> str:
-        if not self._formula:
-            raise ConversionError("empty formula")
-        result = self._parse_formula()
-        self._skip_whitespace()
-        if self._position != len(self._formula):
+Node = tuple
+
+
+class _FOLParser:
+    """Recursive-descent parser building a reusable AST from a token list."""
+
+    def __init__(self, tokens: List[Tuple[int, str]]):
+        self._tokens = tokens
+        self._index = 0
+
+    def parse(self) -> Node:
+        node = self._parse_formula()
+        if self._index != len(self._tokens):
             raise ConversionError("unexpected trailing characters")
-        return self._finalize_sentence(result)
+        return node
 
-    def _parse_formula(self) -> str:
-        self._skip_whitespace()
-        if self._position >= len(self._formula):
-            raise ConversionError("unexpected end of formula")
+    def _peek(self) -> Tuple[int, str]:
+        if self._index >= len(self._tokens):
+            return _EOF_TOKEN
+        return self._tokens[self._index]
 
-        char = self._formula[self._position]
-        if char == "∀":
-            return self._parse_universal()
-        if char == "∃":
-            return self._parse_existential()
-        if char == "¬":
-            self._position += 1
-            return "it is not the case that " + self._parse_formula()
-        if char == "(":
-            self._position += 1
-            result = self._parse_compound_formula()
-            self._expect(")")
-            return result
+    def _parse_formula(self) -> Node:
+        kind = self._peek()[0]
+        if kind == _EOF:
+            raise ConversionError("unexpected end of formula")
+        handler = self._PREFIX_HANDLERS.get(kind)
+        if handler is not None:
+            return handler(self)
         return self._parse_atomic()
 
-    def _parse_universal(self) -> str:
-        self._position += 1  # skip ∀
-        variable = self._consume_variable()
-        self._skip_whitespace()
-        with self._bind_variable(variable, kind="universal") as intro:
-            body = None
-            if self._position < len(self._formula) and self._formula[self._position] == "(":
-                self._position += 1
-                body = self._parse_compound_formula()
-                self._expect(")")
-            elif self._position < len(self._formula):
-                body = self._parse_formula()
-            return f"{intro}, {body}" if body else intro
-
-    def _parse_existential(self) -> str:
-        self._position += 1  # skip ∃
-        variable = self._consume_variable()
-        self._skip_whitespace()
-        with self._bind_variable(variable, kind="existential") as intro:
-            body = None
-            if self._position < len(self._formula) and self._formula[self._position] == "(":
-                self._position += 1
-                body = self._parse_compound_formula()
-                self._expect(")")
-            elif self._position < len(self._formula):
-                body = self._parse_formula()
-            suffix = f" such that {body}" if body else ""
-            return intro + suffix
+    def _parse_universal(self) -> Node:
+        return self._parse_quantified(_N_FORALL)
 
-    def _parse_compound_formula(self) -> str:
-        left = self._parse_subformula()
-        self._skip_whitespace()
+    def _parse_existential(self) -> Node:
+        return self._parse_quantified(_N_EXISTS)
 
-        if self._position >= len(self._formula):
-            return left
+    def _parse_negation(self) -> Node:
+        self._index += 1
+        return (_N_NOT, self._parse_formula())
 
-        char = self._formula[self._position]
-        if char == "∧":
-            self._position += 1
-            right = self._parse_subformula()
-            return f"{left} and {right}"
-        if char == "∨":
-            self._position += 1
-            right = self._parse_subformula()
-            return f"{left} or {right}"
-        if char == "→":
-            self._position += 1
-            right = self._parse_subformula()
-            return f"if {left}, then {right}"
-        if char == "↔":
-            self._position += 1
-            right = self._parse_subformula()
-            return f"{left} if and only if {right}"
-
-        return left
-
-    def _parse_subformula(self) -> str:
-        self._skip_whitespace()
-        if self._position >= len(self._formula):
-            raise ConversionError("unexpected end of subformula")
+    def _parse_group(self) -> Node:
+        self._index += 1
+        node = self._parse_compound_formula()
+        self._expect(_RPAREN, ")")
+        return node
 
-        if self._formula[self._position] == "(":
-            self._position += 1
-            result = self._parse_compound_formula()
-            self._expect(")")
-            return result
+    def _parse_quantified(self, node_kind: int) -> Node:
+        self._index += 1  # skip the quantifier symbol
+        variable = self._consume_variable()
+        body: Optional[Node] = None
+        next_kind = self._peek()[0]
+        if next_kind == _LPAREN:
+            self._index += 1
+            body = self._parse_compound_formula()
+            self._expect(_RPAREN, ")")
+        elif next_kind != _EOF:
+            body = self._parse_formula()
+        return (node_kind, variable, body)
+
+    def _parse_compound_formula(self) -> Node:
+        left = self._parse_subformula()
+        node_kind = _BINARY_NODE_KINDS.get(self._peek()[0])
+        if node_kind is None:
+            return left
+        self._index += 1
+        right = self._parse_subformula()
+        return (node_kind, left, right)
 
+    def _parse_subformula(self) -> Node:
+        kind = self._peek()[0]
+        if kind == _EOF:
+            raise ConversionError("unexpected end of subformula")
+        if kind == _LPAREN:
+            self._index += 1
+            node = self._parse_compound_formula()
+            self._expect(_RPAREN, ")")
+            return node
         return self._parse_atomic()
 
-    def _parse_atomic(self) -> str:
+    def _parse_atomic(self) -> Node:
         predicate = self._consume_identifier()
-        natural_predicate = PREDICATE_MAP.get(predicate, predicate.lower())
-
-        self._skip_whitespace()
-        if self._position >= len(self._formula) or self._formula[self._position] != "(":
-            return natural_predicate
-
-        self._position += 1
-        args = self._consume_arguments()
-        if len(args) == 1:
-            subject, plural = self._format_term(args[0], role="subject")
-            return self._render_unary(subject, natural_predicate, plural)
-        if len(args) == 2:
-            subject, plural = self._format_term(args[0], role="subject")
-            obj, _ = self._format_term(args[1], role="object")
-            return f"{subject} {self._render_binary_verb(natural_predicate, plural)} {obj}"
-        formatted_args = [self._format_term(arg)[0] for arg in args]
-        return f"{natural_predicate} {', '.join(formatted_args)}"
+        if self._peek()[0] != _LPAREN:
+            return (_N_ATOM, predicate, None)
+        self._index += 1
+        return (_N_ATOM, predicate, tuple(self._consume_arguments()))
 
     def _consume_arguments(self) -> List[str]:
         args: List[str] = []
-        current = []
-        while self._position < len(self._formula):
-            char = self._formula[self._position]
-            if char == ")":
-                if current:
-                    args.append("".join(current).strip())
-                    current.clear()
-                self._position += 1
-                break
-            if char == ",":
-                args.append("".join(current).strip())
-                current = []
-                self._position += 1
-                self._skip_whitespace()
+        while True:
+            kind, value = self._peek()
+            if kind == _RPAREN:
+                self._index += 1
+                return args
+            if kind == _COMMA:
+                self._index += 1
+                continue
+            if kind == _IDENT:
+                args.append(value)
+                self._index += 1
                 continue
-            current.append(char)
-            self._position += 1
-        else:
             raise ConversionError("arguments list not terminated")
-        return args
 
     def _consume_identifier(self) -> str:
-        start = self._position
-        while self._position < len(self._formula) and self._formula[self._position].isalpha():
-            self._position += 1
-        if start == self._position:
+        kind, value = self._peek()
+        if kind != _IDENT:
             raise ConversionError("expected identifier")
-        return self._formula[start:self._position]
+        self._index += 1
+        return value
 
     def _consume_variable(self) -> str:
-        if self._position >= len(self._formula) or not self._formula[self._position].isalpha():
+        kind, value = self._peek()
+        if kind != _IDENT:
             raise ConversionError("expected variable")
-        variable = self._formula[self._position]
-        self._position += 1
-        return variable
+        # The lexer is greedy, but a quantifier binds a single-character
+        # variable: in ∃xHuman(x) the identifier token is "xHuman", so keep
+        # the first character and re-queue the rest as the body's leading
+        # identifier.
+        if len(value) > 1:
+            self._tokens[self._index] = (_IDENT, value[1:])
+            return value[0]
+        self._index += 1
+        return value
+
+    def _expect(self, kind: int, symbol: str) -> None:
+        if self._peek()[0] != kind:
+            raise ConversionError(f"expected '{symbol}'")
+        self._index += 1
+
+    # One-probe dispatch on the leading token kind instead of an if cascade.
+    _PREFIX_HANDLERS = {
+        _FORALL: _parse_universal,
+        _EXISTS: _parse_existential,
+        _NOT: _parse_negation,
+        _LPAREN: _parse_group,
+    }
+
+
+@lru_cache(maxsize=512)
+def _parse_to_ast(formula: str) -> Node:
+    """Parse *formula* into an AST, memoizing per formula string.
+
+    The AST is an immutable tuple tree, so cached nodes are safe to render
+    any number of times with fresh variable bindings.
+    """
+    return _FOLParser(_tokenize_fol(formula)).parse()
+
+
+class FOLToNLConverter:
+    def __init__(self, formula: str):
+        self._formula = formula.strip()
+        self._bindings: Dict[str, Tuple[str, str, bool]] = {}
+        self._binding_stack: List[str] = []
+
+    def convert(self) -> str:
+        if not self._formula:
+            raise ConversionError("empty formula")
+        node = _parse_to_ast(self._formula)
+        return self._finalize_sentence(self._render(node))
+
+    def _render(self, node: Node) -> str:
+        return self._RENDER_HANDLERS[node[0]](self, node)
+
+    def _render_universal(self, node: Node) -> str:
+        return self._render_quantified(node, "universal")
 
-    def _expect(self, char: str) -> None:
-        self._skip_whitespace()
-        if self._position >= len(self._formula) or self._formula[self._position] != char:
-            raise ConversionError(f"expected '{char}'")
-        self._position += 1
+    def _render_existential(self, node: Node) -> str:
+        return self._render_quantified(node, "existential")
 
-    def _skip_whitespace(self) -> None:
-        while self._position < len(self._formula) and self._formula[self._position].isspace():
-            self._position += 1
+    def _render_not(self, node: Node) -> str:
+        return "it is not the case that " + self._render(node[1])
+
+    def _render_and(self, node: Node) -> str:
+        return f"{self._render(node[1])} and {self._render(node[2])}"
+
+    def _render_or(self, node: Node) -> str:
+        return f"{self._render(node[1])} or {self._render(node[2])}"
+
+    def _render_implication(self, node: Node) -> str:
+        return f"if {self._render(node[1])}, then {self._render(node[2])}"
+
+    def _render_iff(self, node: Node) -> str:
+        return f"{self._render(node[1])} if and only if {self._render(node[2])}"
+
+    def _render_quantified(self, node: Node, kind: str) -> str:
+        _, variable, body = node
+        with self._bind_variable(variable, kind=kind) as intro:
+            rendered = self._render(body) if body is not None else None
+            if kind == "universal":
+                return f"{intro}, {rendered}" if rendered else intro
+            suffix = f" such that {rendered}" if rendered else ""
+            return intro + suffix
+
+    def _render_atom(self, node: Node) -> str:
+        _, predicate, args = node
+        natural_predicate = PREDICATE_MAP.get(predicate, predicate.lower())
+        if args is None:
+            return natural_predicate
+        if len(args) == 1:
+            subject, plural = self._format_term(args[0], role="subject")
+            templates = _render_entry(natural_predicate)
+            return templates[1 if plural else 0].format(s=subject)
+        if len(args) == 2:
+            subject, plural = self._format_term(args[0], role="subject")
+            obj, _ = self._format_term(args[1], role="object")
+            verb = _render_entry(natural_predicate)[3 if plural else 2]
+            return f"{subject} {verb} {obj}"
+        parts = [natural_predicate]
+        parts.append(", ".join(self._format_term(arg)[0] for arg in args))
+        return " ".join(parts)
 
     def _format_term(self, term: str, role: str = "subject") -> Tuple[str, bool]:
         term = term.strip()
@@ -223,33 +363,6 @@ class FOLToNLConverter:
             return term.capitalize()
         return term
 
-    def _render_unary(self, subject: str, predicate: str, plural: bool) -> str:
-        if predicate.startswith("is "):
-            copula = "are" if plural else "is"
-            return f"{subject} {copula}{predicate[2:]}"
-        return f"{subject} {predicate}"
-
-    def _render_binary_verb(self, predicate: str, plural: bool) -> str:
-        if predicate.startswith("is "):
-            copula = "are" if plural else "is"
-            return f"{copula}{predicate[2:]}"
-        if plural:
-            return self._pluralize_verb(predicate)
-        return predicate
-
-    def _pluralize_verb(self, verb: str) -> str:
-        if verb.endswith("ies"):
-            return verb[:-3] + "y"
-        if verb.endswith("ses") or verb.endswith("xes") or verb.endswith("zes"):
-            return verb[:-2]
-        if verb.endswith("ches") or verb.endswith("shes"):
-            return verb[:-2]
-        if verb.endswith("es"):
-            return verb[:-1]
-        if verb.endswith("s") and not verb.endswith("ss"):
-            return verb[:-1]
-        return verb
-
     @contextmanager
     def _bind_variable(self, variable: str, *, kind: str) -> Iterator[str]:
         if kind == "universal":
@@ -276,9 +389,26 @@ class FOLToNLConverter:
             text += "."
         return text
 
+    # One-probe dispatch on the node kind instead of an if cascade.
+    _RENDER_HANDLERS = {
+        _N_FORALL: _render_universal,
+        _N_EXISTS: _render_existential,
+        _N_NOT: _render_not,
+        _N_AND: _render_and,
+        _N_OR: _render_or,
+        _N_IMP: _render_implication,
+        _N_IFF: _render_iff,
+        _N_ATOM: _render_atom,
+    }
 
+
+@lru_cache(maxsize=2048)
 def convert_fol_to_natural_language(formula: str) -> str:
-    """High-level helper for translating a FOL formula to natural language."""
+    """High-level helper for translating a FOL formula to natural language.
+
+    Results are memoized: conversion is pure, and identical formulas are
+    resubmitted often by long-running callers.
+    """
     return FOLToNLConverter(formula).convert()
 
 
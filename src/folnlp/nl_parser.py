@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable, List
 
 from .tokenizer import Token, TokenType, Tokenizer
@@ -11,9 +12,21 @@ class ParseError(ValueError):
     """Raised when the natural-language statement cannot be parsed."""
 
 
+# Token-type groups used in parser branches, hoisted so the hot paths do a
+# frozenset membership test instead of rebuilding an inline set per call.
+_QUANTIFIER_TYPES = frozenset(
+    {TokenType.EVERY, TokenType.ALL, TokenType.SOME, TokenType.EXISTS, TokenType.NO}
+)
+_UNIVERSAL_TYPES = frozenset({TokenType.EVERY, TokenType.ALL})
+_EXISTENTIAL_TYPES = frozenset({TokenType.SOME, TokenType.EXISTS})
+_CONSEQUENT_TYPES = frozenset({TokenType.IS, TokenType.THEN})
+_CONNECTIVE_TYPES = frozenset({TokenType.AND, TokenType.OR})
+_TERM_TYPES = frozenset({TokenType.CONSTANT, TokenType.VARIABLE})
+
+
 class NLToFOLParser:
     def __init__(self, tokens: Iterable[Token]):
-        self._tokens: List[Token] = list(tokens)
+        self._tokens: List[Token] = tokens if isinstance(tokens, list) else list(tokens)
         if not self._tokens:
             self._tokens = [Token(TokenType.EOF, "")]
         self._position = 0
@@ -32,15 +45,15 @@ class NLToFOLParser:
         return result
 
     def _parse_statement(self) -> str:
-        if self._is_quantifier(self._current.type):
-            return self._parse_quantified()
-        if self._current.type is TokenType.IF:
-            return self._parse_conditional()
-        if self._current.type is TokenType.NOT:
-            self._consume(TokenType.NOT)
-            return f"¬({self._parse_statement()})"
+        handler = self._STATEMENT_HANDLERS.get(self._current.type)
+        if handler is not None:
+            return handler(self)
         return self._parse_compound()
 
+    def _parse_negation(self) -> str:
+        self._consume(TokenType.NOT)
+        return f"¬({self._parse_statement()})"
+
     def _parse_quantified(self) -> str:
         quantifier_token = self._current
         self._advance()
@@ -58,22 +71,22 @@ class NLToFOLParser:
         predicate = self._current.value
         self._advance()
 
-        if quantifier_token.type in {TokenType.EVERY, TokenType.ALL}:
+        if quantifier_token.type in _UNIVERSAL_TYPES:
             quantifier = f"∀{variable}"
-        elif quantifier_token.type in {TokenType.SOME, TokenType.EXISTS}:
+        elif quantifier_token.type in _EXISTENTIAL_TYPES:
             quantifier = f"∃{variable}"
         elif quantifier_token.type is TokenType.NO:
             quantifier = f"¬∃{variable}"
         else:
             raise ParseError("unsupported quantifier")
 
-        if self._current.type in {TokenType.IS, TokenType.THEN}:
+        if self._current.type in _CONSEQUENT_TYPES:
             if self._current.type is TokenType.IS:
                 self._advance()
             if self._current.type is TokenType.NOUN:
                 consequent = self._current.value
                 self._advance()
-                if quantifier_token.type in {TokenType.EVERY, TokenType.ALL}:
+                if quantifier_token.type in _UNIVERSAL_TYPES:
                     return f"{quantifier}({predicate}({variable}) → {consequent}({variable}))"
                 return f"{quantifier}({predicate}({variable}) ∧ {consequent}({variable}))"
             return f"{quantifier}({predicate}({variable}))"
@@ -90,7 +103,7 @@ class NLToFOLParser:
 
     def _parse_compound(self) -> str:
         left = self._parse_atomic()
-        while self._current.type in {TokenType.AND, TokenType.OR}:
+        while self._current.type in _CONNECTIVE_TYPES:
             operator = self._current.type
             self._advance()
             right = self._parse_atomic()
@@ -125,7 +138,7 @@ class NLToFOLParser:
                 self._advance()
                 args: List[str] = []
                 while self._current.type is not TokenType.RPAREN:
-                    if self._current.type in {TokenType.CONSTANT, TokenType.VARIABLE}:
+                    if self._current.type in _TERM_TYPES:
                         args.append(self._current.value)
                         self._advance()
                     if self._current.type is TokenType.COMMA:
@@ -135,14 +148,16 @@ class NLToFOLParser:
 
             return predicate
 
-        raise ParseError(f"unexpected token: {self._current.type}")
+        raise ParseError(f"unexpected token: {self._current.type.name}")
 
     def _is_quantifier(self, token_type: TokenType) -> bool:
-        return token_type in {TokenType.EVERY, TokenType.ALL, TokenType.SOME, TokenType.EXISTS, TokenType.NO}
+        return token_type in _QUANTIFIER_TYPES
 
     def _consume(self, expected: TokenType) -> None:
         if self._current.type is not expected:
-            raise ParseError(f"expected {expected} but found {self._current.type}")
+            raise ParseError(
+                f"expected {expected.name} but found {self._current.type.name}"
+            )
         self._advance()
 
     def _advance(self) -> None:
@@ -152,9 +167,25 @@ class NLToFOLParser:
         else:
             self._current = Token(TokenType.EOF, "")
 
+    # One-probe statement dispatch; anything else falls back to a compound.
+    _STATEMENT_HANDLERS = {
+        TokenType.EVERY: _parse_quantified,
+        TokenType.ALL: _parse_quantified,
+        TokenType.SOME: _parse_quantified,
+        TokenType.EXISTS: _parse_quantified,
+        TokenType.NO: _parse_quantified,
+        TokenType.IF: _parse_conditional,
+        TokenType.NOT: _parse_negation,
+    }
 
+
+@lru_cache(maxsize=2048)
 def parse_natural_language(text: str) -> str:
-    """High-level convenience API for parsing natural language into FOL."""
+    """High-level convenience API for parsing natural language into FOL.
+
+    Results are memoized: parsing is pure, and callers such as the web UI
+    frequently resubmit identical statements.
+    """
     return NLToFOLParser.from_text(text).parse()
 
 
@@ -2,144 +2,159 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import List, Optional, Tuple
+import re
+from enum import IntEnum, auto
+from typing import Dict, List, NamedTuple, Optional
 
 from .vocabulary import AUXILIARIES, CONNECTIVES, CONSTANTS, PREDICATES, QUANTIFIERS
 
 
-class TokenType(str, Enum):
-    EVERY = "EVERY"
-    SOME = "SOME"
-    EXISTS = "EXISTS"
-    ALL = "ALL"
-    NO = "NO"
-    NOT = "NOT"
-    AND = "AND"
-    OR = "OR"
-    IF = "IF"
-    THEN = "THEN"
-    IFF = "IFF"
-    IS = "IS"
-    NOUN = "NOUN"
-    VERB = "VERB"
-    ADJECTIVE = "ADJECTIVE"
-    VARIABLE = "VARIABLE"
-    CONSTANT = "CONSTANT"
-    LPAREN = "LPAREN"
-    RPAREN = "RPAREN"
-    COMMA = "COMMA"
-    DOT = "DOT"
-    EOF = "EOF"
-
-
-@dataclass(frozen=True)
-class Token:
+class TokenType(IntEnum):
+    EVERY = auto()
+    SOME = auto()
+    EXISTS = auto()
+    ALL = auto()
+    NO = auto()
+    NOT = auto()
+    AND = auto()
+    OR = auto()
+    IF = auto()
+    THEN = auto()
+    IFF = auto()
+    IS = auto()
+    NOUN = auto()
+    VERB = auto()
+    ADJECTIVE = auto()
+    VARIABLE = auto()
+    CONSTANT = auto()
+    LPAREN = auto()
+    RPAREN = auto()
+    COMMA = auto()
+    DOT = auto()
+    EOF = auto()
+
+
+class Token(NamedTuple):
     type: TokenType
     value: str
 
 
+def _build_phrase_table() -> Dict[str, Token]:
+    """Map every multiword vocabulary phrase to its canonical token."""
+    entries: Dict[str, Token] = {}
+    for phrase, type_name in QUANTIFIERS.items():
+        if " " in phrase:
+            entries[phrase] = Token(TokenType[type_name], phrase)
+    for phrase, type_name in CONNECTIVES.items():
+        if " " in phrase:
+            entries[phrase] = Token(TokenType[type_name], phrase)
+    for phrase, predicate in PREDICATES.items():
+        if " " in phrase:
+            entries[phrase] = Token(TokenType.NOUN, predicate)
+    return entries
+
+
+_PHRASE_TABLE = _build_phrase_table()
+
+# Canonical tokens for the fixed punctuation and end-of-input markers, so
+# tokenize never allocates for them.
+_PUNCT_TOKENS = {
+    "(": Token(TokenType.LPAREN, "("),
+    ")": Token(TokenType.RPAREN, ")"),
+    ",": Token(TokenType.COMMA, ","),
+    ".": Token(TokenType.DOT, "."),
+}
+_EOF_TOKEN = Token(TokenType.EOF, "")
+
+
+def _compile_token_pattern() -> "re.Pattern[str]":
+    # Longest phrases first so e.g. "if and only if" wins over "if".
+    phrases = sorted(_PHRASE_TABLE, key=len, reverse=True)
+    alternation = "|".join(re.escape(phrase) for phrase in phrases)
+    # [^\W\d_] matches any Unicode letter, so accented words survive intact
+    # instead of being split mid-word.
+    return re.compile(
+        rf"(?P<PHRASE>(?:{alternation}))(?![^\W\d_])"
+        r"|(?P<WORD>[^\W\d_]+)"
+        r"|(?P<PUNCT>[().,])"
+    )
+
+
+_TOKEN_RE = _compile_token_pattern()
+
+# ASCII upper->lower table for str.translate; used as a fast path for the
+# common all-ASCII input, with full str.lower() handling everything else.
+_LOWER_TABLE = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "abcdefghijklmnopqrstuvwxyz",
+)
+
+
+def _build_word_table() -> Dict[str, Optional[Token]]:
+    """Fuse the per-category vocabulary dicts into one classification table.
+
+    Values are canonical pre-instantiated tokens shared by every tokenize
+    call; only out-of-vocabulary nouns allocate a fresh Token.
+    """
+    table: Dict[str, Optional[Token]] = {}
+    for word, type_name in QUANTIFIERS.items():
+        if " " not in word:
+            table[word] = Token(TokenType[type_name], word)
+    for word, type_name in CONNECTIVES.items():
+        if " " not in word:
+            table[word] = Token(TokenType[type_name], word)
+    for word, predicate in PREDICATES.items():
+        if " " not in word:
+            table[word] = Token(TokenType.NOUN, predicate)
+    for word, constant in CONSTANTS.items():
+        table[word] = Token(TokenType.CONSTANT, constant)
+    for word in AUXILIARIES:
+        if word in {"is", "are"}:
+            table[word] = Token(TokenType.IS, word)
+        else:
+            table[word] = None
+    for variable in ("x", "y", "z"):
+        table[variable] = Token(TokenType.VARIABLE, variable)
+    return table
+
+
+_WORD_TABLE = _build_word_table()
+
+# Sentinel distinguishing "not in the vocabulary" from "drop this auxiliary".
+_UNKNOWN = object()
+
+
 class Tokenizer:
     """Converts a natural-language sentence into a stream of tokens."""
 
     def __init__(self, text: str):
-        self._text = text.lower().strip()
-        self._position = 0
+        lowered = text.translate(_LOWER_TABLE) if text.isascii() else text.lower()
+        self._text = lowered.strip()
         self._tokens: List[Token] = []
-        self._multiword_entries: List[Tuple[str, TokenType, str]] = self._build_multiword_entries()
 
     def tokenize(self) -> List[Token]:
-        while self._position < len(self._text):
-            self._skip_whitespace()
-            if self._position >= len(self._text):
-                break
-
-            if self._match_multiword_phrase():
-                continue
-
-            word = self._consume_word()
-            if word:
-                token = self._classify_word(word)
+        for match in _TOKEN_RE.finditer(self._text):
+            group = match.lastgroup
+            if group == "WORD":
+                token = self._classify_word(match.group())
                 if token is not None:
                     self._tokens.append(token)
-                continue
-
-            char = self._text[self._position]
-            if char == "(":
-                self._tokens.append(Token(TokenType.LPAREN, char))
-            elif char == ")":
-                self._tokens.append(Token(TokenType.RPAREN, char))
-            elif char == ",":
-                self._tokens.append(Token(TokenType.COMMA, char))
-            elif char == ".":
-                self._tokens.append(Token(TokenType.DOT, char))
-            self._position += 1
-
-        self._tokens.append(Token(TokenType.EOF, ""))
-        return list(self._tokens)
-
-    def _build_multiword_entries(self) -> List[Tuple[str, TokenType, str]]:
-        entries: List[Tuple[str, TokenType, str]] = []
-        for phrase, type_name in QUANTIFIERS.items():
-            if " " in phrase:
-                entries.append((phrase, TokenType(type_name), phrase))
-        for phrase, type_name in CONNECTIVES.items():
-            if " " in phrase:
-                entries.append((phrase, TokenType(type_name), phrase))
-        for phrase, predicate in PREDICATES.items():
-            if " " in phrase:
-                entries.append((phrase, TokenType.NOUN, predicate))
-        entries.sort(key=lambda item: len(item[0]), reverse=True)
-        return entries
-
-    def _match_multiword_phrase(self) -> bool:
-        for phrase, token_type, value in self._multiword_entries:
-            if not self._text.startswith(phrase, self._position):
-                continue
-            end = self._position + len(phrase)
-            if end < len(self._text) and self._text[end].isalpha():
-                continue
-            self._tokens.append(Token(token_type, value))
-            self._position = end
-            return True
-        return False
-
-    def _consume_word(self) -> str:
-        start = self._position
-        while self._position < len(self._text) and self._text[self._position].isalpha():
-            self._position += 1
-        return self._text[start:self._position]
+            elif group == "PHRASE":
+                self._tokens.append(_PHRASE_TABLE[match.group()])
+            else:
+                self._tokens.append(_PUNCT_TOKENS[match.group()])
+
+        self._tokens.append(_EOF_TOKEN)
+        return self._tokens
 
     def _classify_word(self, word: str) -> Optional[Token]:
         if not word:
             return None
 
-        if word in QUANTIFIERS:
-            return Token(TokenType(QUANTIFIERS[word]), word)
-
-        if word in CONNECTIVES:
-            return Token(TokenType(CONNECTIVES[word]), word)
-
-        if word in PREDICATES:
-            return Token(TokenType.NOUN, PREDICATES[word])
-
-        if word in CONSTANTS:
-            return Token(TokenType.CONSTANT, CONSTANTS[word])
-
-        if word in AUXILIARIES:
-            if word in {"is", "are"}:
-                return Token(TokenType.IS, word)
-            return None
-
-        if len(word) == 1 and word in {"x", "y", "z"}:
-            return Token(TokenType.VARIABLE, word)
-
-        return Token(TokenType.NOUN, word.capitalize())
-
-    def _skip_whitespace(self) -> None:
-        while self._position < len(self._text) and self._text[self._position].isspace():
-            self._position += 1
+        token = _WORD_TABLE.get(word, _UNKNOWN)
+        if token is _UNKNOWN:
+            return Token(TokenType.NOUN, word.capitalize())
+        return token
 
 
 def tokenize(text: str) -> List[Token]:
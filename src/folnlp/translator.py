@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import List, Sequence
+
 from .fol_to_nl import ConversionError, convert_fol_to_natural_language
 from .nl_parser import NLToFOLParser, ParseError, parse_natural_language
 
@@ -14,7 +16,9 @@ def translate_nl_to_fol(text: str) -> str:
     if not text or not text.strip():
         raise TranslationError("natural language statement is empty")
     try:
-        return parse_natural_language(text)
+        # The tokenizer lowercases and strips anyway; normalizing here lets
+        # trivial whitespace/case variants share one cache slot.
+        return parse_natural_language(text.strip().lower())
     except ParseError as exc:
         raise TranslationError(str(exc)) from exc
 
@@ -23,13 +27,30 @@ def translate_fol_to_nl(formula: str) -> str:
     if not formula or not formula.strip():
         raise TranslationError("FOL formula is empty")
     try:
-        return convert_fol_to_natural_language(formula)
+        return convert_fol_to_natural_language(formula.strip())
     except ConversionError as exc:
         raise TranslationError(str(exc)) from exc
 
 
+def translate_nl_to_fol_batch(texts: Sequence[str]) -> List[str]:
+    """Translate many natural-language statements in one call.
+
+    The per-call setup (compiled patterns, memoized parses) is shared
+    across the whole batch; duplicate inputs are answered from cache.
+    Raises TranslationError on the first untranslatable item.
+    """
+    return [translate_nl_to_fol(text) for text in texts]
+
+
+def translate_fol_to_nl_batch(formulas: Sequence[str]) -> List[str]:
+    """Translate many FOL formulas in one call; see translate_nl_to_fol_batch."""
+    return [translate_fol_to_nl(formula) for formula in formulas]
+
+
 __all__ = [
     "TranslationError",
     "translate_fol_to_nl",
+    "translate_fol_to_nl_batch",
     "translate_nl_to_fol",
+    "translate_nl_to_fol_batch",
 ]
@@ -1,6 +1,12 @@
 """Vocabulary definitions for the FOL/NL translator."""
 
-QUANTIFIERS = {
+from types import MappingProxyType
+
+# The vocabulary tables are read-only: the tokenizer compiles them into a
+# single classification table at import, so mutating them later would have
+# no effect. MappingProxyType/frozenset make that contract explicit.
+
+QUANTIFIERS = MappingProxyType({
     "every": "EVERY",
     "all": "ALL",
     "some": "SOME",
@@ -9,9 +15,9 @@ QUANTIFIERS = {
     "no": "NO",
     "for all": "ALL",
     "for every": "EVERY",
-}
+})
 
-CONNECTIVES = {
+CONNECTIVES = MappingProxyType({
     "and": "AND",
     "or": "OR",
     "not": "NOT",
@@ -20,9 +26,9 @@ CONNECTIVES = {
     "implies": "THEN",
     "iff": "IFF",
     "if and only if": "IFF",
-}
+})
 
-PREDICATES = {
+PREDICATES = MappingProxyType({
     # Unary predicates
     "human": "Human",
     "mortal": "Mortal",
@@ -43,9 +49,9 @@ PREDICATES = {
     "friend of": "FriendOf",
     "greater than": "GreaterThan",
     "equals": "Equals",
-}
+})
 
-CONSTANTS = {
+CONSTANTS = MappingProxyType({
     "socrates": "socrates",
     "plato": "plato",
     "aristotle": "aristotle",
@@ -53,9 +59,9 @@ CONSTANTS = {
     "bob": "bob",
     "john": "john",
     "mary": "mary",
-}
+})
 
-AUXILIARIES = {"is", "are", "has", "have", "that", "who", "which", "a", "an", "the"}
+AUXILIARIES = frozenset({"is", "are", "has", "have", "that", "who", "which", "a", "an", "the"})
 
 __all__ = [
     "QUANTIFIERS",
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import base64
+import gzip
+import hashlib
+import json
+import os
 import random
 import re
-import uuid
-from collections import OrderedDict
-from dataclasses import dataclass
-from threading import Lock
-from typing import Dict, List, Optional
+import sys
+from functools import lru_cache
+from queue import Empty, SimpleQueue
+from threading import Event, Lock, Thread, local
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from flask import Flask, Response, jsonify, request
 
@@ -28,7 +33,18 @@ MODE_INSTRUCTIONS = {
     MODE_FOL_TO_NL: "Arrange the blocks to build the matching natural-language sentence.",
 }
 
-LOGIC_SYMBOLS = {"¬", "∧", "∨", "→", "↔", "(", ")", ",", ";"}
+try:  # pragma: no cover - optional speedup, depends on env
+    import re2 as _regex
+except ModuleNotFoundError:
+    _regex = re
+
+# Compiled with google-re2 when installed (linear-time matching), falling
+# back to the stdlib engine otherwise; the pattern works under both.
+_NL_TOKEN_RE = _regex.compile(r"[A-Za-z']+|[0-9]+|[^\w\s]")
+
+# A FOL answer splits into quantifier-plus-variable runs, single logic
+# symbols, and runs of anything else that is not whitespace or a symbol.
+_FOL_TOKEN_RE = re.compile(r"[∀∃][a-z]*|[¬∧∨→↔(),;]|[^\s∀∃¬∧∨→↔(),;]+")
 
 EXAMPLES = [
     {"nl": "Every human is mortal", "fol": "∀x(Human(x) → Mortal(x))"},
@@ -43,109 +59,124 @@ EXAMPLES = [
 
 
 def tokenize_fol_answer(formula: str) -> List[str]:
-    tokens: List[str] = []
-    buffer: List[str] = []
-    i = 0
-    while i < len(formula):
-        char = formula[i]
-        if char.isspace():
-            if buffer:
-                tokens.append("".join(buffer))
-                buffer.clear()
-            i += 1
-            continue
-        if char in {"∀", "∃"}:
-            if buffer:
-                tokens.append("".join(buffer))
-                buffer.clear()
-            j = i + 1
-            token = char
-            while j < len(formula) and formula[j].islower():
-                token += formula[j]
-                j += 1
-            tokens.append(token)
-            i = j
-            continue
-        if char in LOGIC_SYMBOLS:
-            if buffer:
-                tokens.append("".join(buffer))
-                buffer.clear()
-            tokens.append(char)
-            i += 1
-            continue
-        buffer.append(char)
-        i += 1
-    if buffer:
-        tokens.append("".join(buffer))
-    return tokens
+    return _FOL_TOKEN_RE.findall(formula)
 
 
 def tokenize_natural_language(sentence: str) -> List[str]:
     if not sentence:
         return []
-    return re.findall(r"[A-Za-z']+|[0-9]+|[^\w\s]", sentence)
+    return _NL_TOKEN_RE.findall(sentence)
+
+
+@lru_cache(maxsize=256)
+def _tokenize_for_mode_cached(text: str, mode: str) -> Tuple[str, ...]:
+    tokens = tokenize_fol_answer(text) if mode == MODE_NL_TO_FOL else tokenize_natural_language(text)
+    return tuple(tokens)
 
 
 def tokenize_for_mode(text: str, mode: str) -> List[str]:
-    if mode == MODE_NL_TO_FOL:
-        return tokenize_fol_answer(text)
-    return tokenize_natural_language(text)
+    return list(_tokenize_for_mode_cached(text, mode))
+
+
+# Tokens that attach directly to the preceding text, and operators that
+# always get a space on their left.
+_FOL_GLUE_TOKENS = frozenset({"(", ")", ",", ";"})
+_FOL_BINARY_OPS = frozenset({"∧", "∨", "→", "↔"})
 
 
-def _assemble_fol(tokens: List[str]) -> str:
-    result = ""
+def _assemble_fol(tokens: Sequence[str]) -> str:
+    # Single pass over the tokens with one final join; the old version
+    # rebuilt the string per token and then re-scanned it three times.
+    parts: List[str] = []
+    last_char = ""
     for token in tokens:
-        if not result:
-            result = token
-        elif token in {")",
-            ",",
-            ";",
-        }:
-            result = result.rstrip() + token
-        elif token == "(":
-            if result and result[-1] not in {"(", "¬", " "}:
-                result = result.rstrip()
-            result += "("
-        elif token == "¬":
-            if result and result[-1] not in {"(", " "}:
-                result = result.rstrip() + " "
-            result += "¬"
-        elif token in {"∧", "∨", "→", "↔"}:
-            result = result.rstrip() + f" {token} "
-        else:
-            if result and result[-1] not in {"(", "¬", " "}:
-                result += " "
-            result += token
-    result = " ".join(result.split())
-    result = result.replace(" (", "(")
-    result = result.replace(" )", ")")
-    result = result.replace(" ,", ",")
-    return result.strip()
-
-
-def _assemble_nl(tokens: List[str]) -> str:
-    result = ""
+        if not token:
+            continue
+        if parts:
+            if token in _FOL_GLUE_TOKENS:
+                pass
+            elif token in _FOL_BINARY_OPS:
+                parts.append(" ")
+            elif token == "¬":
+                if last_char != "(":
+                    parts.append(" ")
+            elif last_char not in ("(", "¬"):
+                parts.append(" ")
+        parts.append(token)
+        last_char = token[-1]
+    return "".join(parts)
+
+
+# Punctuation that attaches to the preceding word in natural language.
+_NL_CLOSERS = frozenset({".", ",", ";", ":", "?", "!", ")"})
+
+
+def _assemble_nl(tokens: Sequence[str]) -> str:
+    # Everything except closing punctuation gets a space before it; collect
+    # parts and join once instead of growing a string per token.
+    parts: List[str] = []
     for token in tokens:
-        if not result:
-            result = token
-        elif token in {".", ",", ";", ":", "?", "!", ")"}:
-            result = result.rstrip() + token
-        elif token in {"(", "[", "{"}:
-            result += " " + token
-        else:
-            result += " " + token
-    return result.strip()
+        if parts and token not in _NL_CLOSERS:
+            parts.append(" ")
+        parts.append(token)
+    return "".join(parts).strip()
 
 
-def assemble_for_mode(tokens: List[str], mode: str) -> str:
+@lru_cache(maxsize=256)
+def _assemble_for_mode_cached(tokens: Tuple[str, ...], mode: str) -> str:
     return _assemble_fol(tokens) if mode == MODE_NL_TO_FOL else _assemble_nl(tokens)
 
 
-@dataclass
-class StoredChallenge:
+def assemble_for_mode(tokens: List[str], mode: str) -> str:
+    return _assemble_for_mode_cached(tuple(tokens), mode)
+
+
+_thread_state = local()
+
+
+def _rng() -> random.Random:
+    """Per-thread Random instance, so concurrent requests never contend on
+    the global RNG's internal lock."""
+    rng = getattr(_thread_state, "rng", None)
+    if rng is None:
+        rng = _thread_state.rng = random.Random(os.urandom(8))
+    return rng
+
+
+def _prepare_examples() -> Dict[str, Tuple[Dict[str, object], ...]]:
+    """Pre-tokenize every example for both modes once, at import time.
+
+    Challenge creation then only shuffles and labels; it never re-runs the
+    tokenizers or assemblers for the fixed example pool.
+    """
+    prepared: Dict[str, List[Dict[str, object]]] = {MODE_NL_TO_FOL: [], MODE_FOL_TO_NL: []}
+    for example in EXAMPLES:
+        for mode in (MODE_NL_TO_FOL, MODE_FOL_TO_NL):
+            prompt = example["nl"] if mode == MODE_NL_TO_FOL else example["fol"]
+            answer = example["fol"] if mode == MODE_NL_TO_FOL else example["nl"]
+            # Interned tokens make the repeated equality checks during
+            # assembly and payload construction pointer comparisons.
+            tokens = tuple(sys.intern(token) for token in _tokenize_for_mode_cached(answer, mode))
+            prepared[mode].append(
+                {
+                    "prompt": prompt,
+                    "tokens": tokens,
+                    "expected_text": _assemble_for_mode_cached(tokens, mode),
+                }
+            )
+    return {mode: tuple(entries) for mode, entries in prepared.items()}
+
+
+_PREPARED_EXAMPLES = _prepare_examples()
+
+
+class StoredChallenge(NamedTuple):
     mode: str
-    answer_order: List[str]
-    id_to_token: Dict[str, str]
+    # IDs are fixed-width, so the expected order is stored as one joined
+    # string and checked with a single comparison; the set backs the
+    # missing/extra diagnostics.
+    answer_key: str
+    answer_set: frozenset
     expected_text: str
     token_count: int
 
@@ -153,60 +184,107 @@ class StoredChallenge:
 class ChallengeManager:
     """Tracks generated block challenges so they can be validated."""
 
-    def __init__(self, *, max_entries: int = 64) -> None:
+    def __init__(self, *, max_entries: int = 64, prebuild_depth: int = 8) -> None:
         self._lock = Lock()
-        self._store: "OrderedDict[str, StoredChallenge]" = OrderedDict()
+        # Plain dicts preserve insertion order, which is all the FIFO
+        # eviction below needs; OrderedDict would only add overhead.
+        self._store: Dict[str, StoredChallenge] = {}
         self._max_entries = max_entries
+        # Per-mode queues of ready-to-serve challenges, topped up by a lazy
+        # daemon thread so request handlers usually just dequeue.
+        self._prebuild_depth = prebuild_depth
+        self._prebuilt: Dict[str, "SimpleQueue"] = {
+            MODE_NL_TO_FOL: SimpleQueue(),
+            MODE_FOL_TO_NL: SimpleQueue(),
+        }
+        self._refill = Event()
+        self._worker: Optional[Thread] = None
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = Thread(target=self._prebuild_loop, daemon=True)
+                    self._worker.start()
+
+    def _prebuild_loop(self) -> None:  # pragma: no cover - exercised indirectly
+        while True:
+            self._refill.wait()
+            self._refill.clear()
+            for mode, prebuilt in self._prebuilt.items():
+                while prebuilt.qsize() < self._prebuild_depth:
+                    prebuilt.put(self._build_challenge(mode))
 
     def create_challenge(self, *, forced_mode: Optional[str] = None) -> Dict[str, object]:
-        example = random.choice(EXAMPLES)
         if forced_mode in {None, MODE_MIXED}:
-            mode = random.choice([MODE_NL_TO_FOL, MODE_FOL_TO_NL])
+            mode = _rng().choice([MODE_NL_TO_FOL, MODE_FOL_TO_NL])
         else:
             mode = forced_mode
-        prompt = example["nl"] if mode == MODE_NL_TO_FOL else example["fol"]
-        answer = example["fol"] if mode == MODE_NL_TO_FOL else example["nl"]
-        tokens = tokenize_for_mode(answer, mode)
-
-        answer_order: List[str] = []
-        id_to_token: Dict[str, str] = {}
-        token_payload: List[Dict[str, str]] = []
-        for token in tokens:
-            token_id = uuid.uuid4().hex
-            answer_order.append(token_id)
-            id_to_token[token_id] = token
-            token_payload.append({"id": token_id, "text": token})
-
-        shuffled_payload = token_payload[:]
-        random.shuffle(shuffled_payload)
-
-        challenge_id = uuid.uuid4().hex
-        stored = StoredChallenge(
-            mode=mode,
-            answer_order=answer_order,
-            id_to_token=id_to_token,
-            expected_text=assemble_for_mode(tokens, mode),
-            token_count=len(tokens),
-        )
+
+        try:
+            challenge_id, stored, payload = self._prebuilt[mode].get_nowait()
+        except Empty:
+            challenge_id, stored, payload = self._build_challenge(mode)
+
+        self._ensure_worker()
+        self._refill.set()
 
         with self._lock:
             self._store[challenge_id] = stored
-            while len(self._store) > self._max_entries:
-                self._store.popitem(last=False)
+            # Entries are inserted one at a time under the lock, so at most
+            # one eviction is ever needed.
+            if len(self._store) > self._max_entries:
+                self._store.pop(next(iter(self._store)))
+
+        return payload
+
+    def _build_challenge(self, mode: str) -> "Tuple[str, StoredChallenge, Dict[str, object]]":
+        rng = _rng()
+        entry = rng.choice(_PREPARED_EXAMPLES[mode])
+        tokens = entry["tokens"]
+        token_count = len(tokens)
+
+        # One urandom read covers every token ID plus the challenge ID;
+        # per-ID uuid4 construction was the dominant cost here. 12 random
+        # bytes encode to 16 urlsafe characters with no padding, shrinking
+        # both the JSON payload and the stored answer key.
+        raw = os.urandom(12 * (token_count + 1))
+        ids = [
+            base64.urlsafe_b64encode(raw[offset : offset + 12]).decode("ascii")
+            for offset in range(0, len(raw), 12)
+        ]
+        challenge_id = ids.pop()
+
+        # Shuffle indices and build the payload dicts directly in shuffled
+        # order, instead of materializing an ordered list and copying it.
+        order = list(range(token_count))
+        rng.shuffle(order)
+        shuffled_payload: List[Dict[str, str]] = [
+            {"id": ids[i], "text": tokens[i]} for i in order
+        ]
+        stored = StoredChallenge(
+            mode=mode,
+            answer_key="".join(ids),
+            answer_set=frozenset(ids),
+            expected_text=entry["expected_text"],
+            token_count=token_count,
+        )
 
-        return {
+        payload: Dict[str, object] = {
             "id": challenge_id,
             "mode": mode,
             "mode_label": MODE_LABELS[mode],
-            "prompt": prompt,
+            "prompt": entry["prompt"],
             "instructions": MODE_INSTRUCTIONS[mode],
             "tokens": shuffled_payload,
-            "token_count": len(tokens),
+            "token_count": token_count,
         }
+        return challenge_id, stored, payload
 
     def verify(self, challenge_id: str, selection: List[str]) -> Optional[Dict[str, object]]:
-        with self._lock:
-            stored = self._store.get(challenge_id)
+        # A single dict.get is atomic under the GIL and stored entries are
+        # never mutated after insertion, so no lock is needed to read.
+        stored = self._store.get(challenge_id)
 
         if stored is None:
             return None
@@ -217,7 +295,19 @@ class ChallengeManager:
                 "message": "Select blocks before checking your answer.",
             }
 
-        if any(token_id not in stored.id_to_token for token_id in selection):
+        # Correct answers are the common case once a player is done, so
+        # check them first: a length test plus one string compare.
+        if len(selection) == stored.token_count and "".join(selection) == stored.answer_key:
+            with self._lock:
+                self._store.pop(challenge_id, None)
+            return {
+                "correct": True,
+                "message": "Nice work! That matches the expected translation.",
+                "expected": stored.expected_text,
+                "mode": stored.mode,
+            }
+
+        if not stored.answer_set.issuperset(selection):
             return {
                 "correct": False,
                 "message": "One or more selected blocks are not part of this challenge.",
@@ -229,18 +319,7 @@ class ChallengeManager:
                 "message": f"You have used {len(selection)} of {stored.token_count} blocks. Keep going!",
             }
 
-        if selection == stored.answer_order:
-            with self._lock:
-                self._store.pop(challenge_id, None)
-            return {
-                "correct": True,
-                "message": "Nice work! That matches the expected translation.",
-                "expected": stored.expected_text,
-                "mode": stored.mode,
-            }
-
-        expected_set = set(stored.answer_order)
-        if set(selection) != expected_set:
+        if set(selection) != stored.answer_set:
             return {
                 "correct": False,
                 "message": "Something is missing or extra. Double-check the blocks you used.",
@@ -256,6 +335,25 @@ challenge_manager = ChallengeManager()
 
 app = Flask(__name__)
 
+try:  # pragma: no cover - optional speedup, depends on env
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ModuleNotFoundError:
+    orjson = None
+
+if orjson is not None:
+
+    class _OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson when it is installed."""
+
+        def dumps(self, obj: object, **kwargs: object) -> str:
+            return orjson.dumps(obj).decode("utf-8")
+
+        def loads(self, s: "str | bytes", **kwargs: object):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
 _INDEX_HTML = """<!DOCTYPE html>
 <html lang=\"en\">
 <head>
@@ -949,22 +1047,47 @@ _INDEX_HTML = """<!DOCTYPE html>
 """
 
 
+def _error_response(message: str, status: int) -> Response:
+    # Error payloads are tiny and fixed-shape; build the response directly
+    # rather than going through jsonify and the provider machinery.
+    body = json.dumps({"ok": False, "error": message})
+    return Response(body, status=status, mimetype="application/json")
+
+
 def _translate(func, payload: Optional[str]):
     if payload is None:
         raise TranslationError("request body must be JSON with a 'text' key")
     return func(payload)
 
 
+# The landing page is static, so compress and fingerprint it once at
+# import instead of shipping ~25 KB of HTML per request.
+_INDEX_BODY = _INDEX_HTML.encode("utf-8")
+_INDEX_GZIP = gzip.compress(_INDEX_BODY, compresslevel=9)
+_INDEX_ETAG = '"{}"'.format(hashlib.blake2b(_INDEX_BODY, digest_size=16).hexdigest())
+
+
 @app.get("/")
 def index() -> Response:
-    return Response(_INDEX_HTML, mimetype="text/html")
+    if request.headers.get("If-None-Match") == _INDEX_ETAG:
+        response = Response(status=304)
+    elif "gzip" in request.headers.get("Accept-Encoding", ""):
+        response = Response(_INDEX_GZIP, mimetype="text/html")
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Vary"] = "Accept-Encoding"
+    else:
+        response = Response(_INDEX_BODY, mimetype="text/html")
+    response.headers["ETag"] = _INDEX_ETAG
+    # Let clients revalidate cheaply instead of re-downloading the page.
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @app.get("/api/practice")
 def practice_challenge():
     mode = request.args.get("mode", MODE_MIXED)
     if mode not in {MODE_MIXED, MODE_NL_TO_FOL, MODE_FOL_TO_NL}:
-        return jsonify({"ok": False, "error": "Unknown practice mode."}), 400
+        return _error_response("Unknown practice mode.", 400)
     challenge = challenge_manager.create_challenge(forced_mode=mode)
     return jsonify({"ok": True, "challenge": challenge})
 
@@ -976,48 +1099,117 @@ def practice_verify():
     tokens = payload.get("tokens")
 
     if not isinstance(challenge_id, str) or not isinstance(tokens, list):
-        return jsonify({"ok": False, "error": "Invalid request payload."}), 400
+        return _error_response("Invalid request payload.", 400)
 
-    selection: List[str] = []
-    for token_id in tokens:
-        if not isinstance(token_id, str):
-            return jsonify({"ok": False, "error": "Token identifiers must be strings."}), 400
-        selection.append(token_id)
+    # Exact type check: JSON never yields str subclasses, and type-is is
+    # cheaper than isinstance in this per-element scan.
+    if not all(type(token_id) is str for token_id in tokens):
+        return _error_response("Token identifiers must be strings.", 400)
 
-    result = challenge_manager.verify(challenge_id, selection)
+    result = challenge_manager.verify(challenge_id, tokens)
     if result is None:
-        return jsonify({"ok": False, "error": "Challenge expired or unknown."}), 404
+        return _error_response("Challenge expired or unknown.", 404)
 
-    return jsonify({"ok": True, **result})
+    # verify() builds a fresh dict per call, so tag it in place rather than
+    # unpacking into a second dict.
+    result["ok"] = True
+    return jsonify(result)
 
 
-# Retain simple translator API for potential reuse
-@app.post("/api/nl-to-fol")
-def nl_to_fol_endpoint():
+def _translation_response(func, direction: str):
+    """Shared endpoint body with ETag revalidation.
+
+    Translation is deterministic, so the ETag is a digest of the input
+    text; a matching If-None-Match skips the translation entirely.
+    """
     payload = request.get_json(silent=True) or {}
     text = payload.get("text")
+
+    etag = None
+    if isinstance(text, str):
+        digest = hashlib.blake2b(f"{direction}:{text}".encode("utf-8"), digest_size=16)
+        etag = f'"{digest.hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status=304)
+
     try:
-        result = _translate(translate_nl_to_fol, text)
+        result = _translate(func, text)
     except TranslationError as exc:
-        return jsonify({"ok": False, "error": str(exc)}), 400
-    return jsonify({"ok": True, "result": result})
+        return _error_response(str(exc), 400)
+
+    response = jsonify({"ok": True, "result": result})
+    if etag is not None:
+        response.headers["ETag"] = etag
+    return response
+
+
+# Retain simple translator API for potential reuse
+@app.post("/api/nl-to-fol")
+def nl_to_fol_endpoint():
+    return _translation_response(translate_nl_to_fol, "nl2fol")
 
 
 @app.post("/api/fol-to-nl")
 def fol_to_nl_endpoint():
+    return _translation_response(translate_fol_to_nl, "fol2nl")
+
+
+def _translate_batch(func):
     payload = request.get_json(silent=True) or {}
-    text = payload.get("text")
-    try:
-        result = _translate(translate_fol_to_nl, text)
-    except TranslationError as exc:
-        return jsonify({"ok": False, "error": str(exc)}), 400
-    return jsonify({"ok": True, "result": result})
+    texts = payload.get("texts")
+    if not isinstance(texts, list) or not all(type(text) is str for text in texts):
+        return _error_response("Request body must be JSON with a 'texts' list of strings.", 400)
+
+    # One request amortizes HTTP and JSON overhead over many translations;
+    # failures are reported per item instead of failing the whole batch.
+    results: List[Optional[str]] = []
+    errors: List[Optional[str]] = []
+    for text in texts:
+        try:
+            results.append(func(text))
+            errors.append(None)
+        except TranslationError as exc:
+            results.append(None)
+            errors.append(str(exc))
+    return jsonify({"ok": True, "results": results, "errors": errors})
+
+
+@app.post("/api/nl-to-fol/batch")
+def nl_to_fol_batch_endpoint():
+    return _translate_batch(translate_nl_to_fol)
+
+
+@app.post("/api/fol-to-nl/batch")
+def fol_to_nl_batch_endpoint():
+    return _translate_batch(translate_fol_to_nl)
+
+
+def _warmup() -> None:  # pragma: no cover - background priming
+    """Prime the translator caches with the example pool off the main thread.
+
+    Not every example round-trips through both translators; failures just
+    mean there is nothing to cache for that input.
+    """
+    for example in EXAMPLES:
+        for func, text in (
+            (translate_nl_to_fol, example["nl"]),
+            (translate_fol_to_nl, example["fol"]),
+        ):
+            try:
+                func(text)
+            except TranslationError:
+                pass
+
+
+Thread(target=_warmup, daemon=True).start()
 
 
 def run(host: str = "127.0.0.1", port: int = 8000) -> None:
     """Start the Flask development server."""
 
-    app.run(host=host, port=port, debug=False)
+    # threaded=True lets slow clients overlap instead of serializing every
+    # request on one thread; the handlers are thread-safe by design.
+    app.run(host=host, port=port, debug=False, threaded=True)
 
 
 __all__ = [
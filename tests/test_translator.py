@@ -23,6 +23,9 @@ class TranslateNLToFOLTests(unittest.TestCase):
         expected = "¬∃x(Student(x) ∧ Teacher(x))"
         self.assertEqual(translate_nl_to_fol("No student is a teacher."), expected)
 
+    def test_non_ascii_noun_survives_intact(self) -> None:
+        self.assertEqual(translate_nl_to_fol("no café"), "¬∃x(Café(x))")
+
 
 class TranslateFOLToNLTests(unittest.TestCase):
     def test_universal_quantifier_roundtrip(self) -> None:
@@ -31,6 +34,29 @@ class TranslateFOLToNLTests(unittest.TestCase):
         self.assertIn("if they are human", sentence)
         self.assertIn("then they are mortal", sentence)
 
+    def test_negated_existential(self) -> None:
+        sentence = translate_fol_to_nl("¬∃x(Student(x) ∧ Teacher(x))")
+        self.assertEqual(
+            sentence,
+            "It is not the case that there exists someone such that "
+            "they are a student and they are a teacher.",
+        )
+
+    def test_binary_predicate_with_constants(self) -> None:
+        self.assertEqual(translate_fol_to_nl("Loves(alice, bob)"), "Alice loves Bob.")
+
+    def test_unparenthesized_quantified_body(self) -> None:
+        self.assertEqual(
+            translate_fol_to_nl("∃xHuman(x)"),
+            "There exists someone such that they are human.",
+        )
+
+    def test_unparenthesized_binary_predicate_body(self) -> None:
+        self.assertEqual(
+            translate_fol_to_nl("∀xGreaterThan(x, y)"),
+            "For every individual, they are greater than y.",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()